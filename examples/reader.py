@@ -5,6 +5,9 @@ from p2000.rtlsdr import AbstractReader
 class MyReader(AbstractReader):
 
     def act(self, raw):
+        if self.is_raw_blacklisted(raw):
+            print("== LINE IS BLACKLISTED ==")
+            return
         line = self.create_line(raw)
         if self.is_line_blacklisted(line):
             print("== LINE IS BLACKLISTED ==")
@@ -1,4 +1,6 @@
 import abc
+import os
+import sys
 
 from requests import ConnectionError
 
@@ -8,19 +10,46 @@ from subprocess import Popen, PIPE, call
 
 class Line:
 
-    def __init__(self, line, **kwargs):
+    __slots__ = ("line", "timestamp", "monitorcode", "message")
+
+    def __init__(self, line, *, timestamp=None, monitorcode=None, message=None):
         """
         Create a new FLEX Line object with data from the given line.
+        The line is only parsed when not all of the fields are given as keywords.
         :param line: The line to extract the data from.
         :keyword timestamp: The timestamp to set to the object.
         :keyword monitorcode: The monitorcode to set to the object.
         :keyword message: The message to set to the object.
+        :raises ValueError: When the line has to be parsed but is not a valid FLEX line.
         """
-        words = line.split()
+        if timestamp is None or monitorcode is None or message is None:
+            parsed_timestamp, parsed_monitorcode, parsed_message = self.__parse__(line)
+            timestamp = parsed_timestamp if timestamp is None else timestamp
+            monitorcode = parsed_monitorcode if monitorcode is None else monitorcode
+            message = parsed_message if message is None else message
         self.line = line
-        self.timestamp = kwargs.get('timestamp', " ".join(words[1:2]))
-        self.monitorcode = kwargs.get('monitorcode', words[5].strip("[]"))
-        self.message = kwargs.get('message', " ".join(words[6:-1]))
+        self.timestamp = timestamp
+        self.monitorcode = monitorcode
+        self.message = message
+
+    def __parse__(self, line):
+        """
+        Extract the fields from the given line.
+        Only the first 6 words are split off, the last word is then split off the remainder to get the message.
+        The monitorcode is interned, since they come from a small set of codes that are compared against the blacklist.
+        :param line: The line to parse.
+        :return: A tuple with the timestamp, monitorcode and message, the message defaults to an empty String.
+        :raises ValueError: When the line is not a valid FLEX line.
+        """
+        words = line.split(None, 6)
+        if len(words) < 6:
+            raise ValueError("'{0}' is not a valid FLEX line.".format(line))
+        message = ""
+        if len(words) == 7:
+            rest = words[6].rsplit(None, 1)
+            if len(rest) == 2:
+                message = rest[0]
+        return words[1], sys.intern(words[5].strip("[]")), message
 
     def __str__(self):
         """
@@ -31,10 +60,10 @@ class Line:
             "\t@timestamp = {2}\n" \
             "\t@monitorcode = {3}"
         """
-        return "@line = {0}\n" \
-               "\t@message = {1}\n" \
-               "\t@timestamp = {2}\n" \
-               "\t@monitorcode = {3}".format(self.line, self.message, self.timestamp, self.monitorcode)
+        return f"@line = {self.line}\n" \
+               f"\t@message = {self.message}\n" \
+               f"\t@timestamp = {self.timestamp}\n" \
+               f"\t@monitorcode = {self.monitorcode}"
 
 
 class Connection:
@@ -54,21 +83,32 @@ class Connection:
         Spawns 2 processes:
             * rtl_fm - A process that runs an instance of rtl_fm that connects to the antenna.
             * multimon-ng - A process that runs an instance of multimon_ng that decodes the FLEX protocol messages.
-        :keyword kill: To kill or not kill any current running processes, default is True.
+        The stdout of multimon-ng is unbuffered, readers take it in chunks straight from its file descriptor.
+        :keyword kill: To kill or not kill any current running rtl_fm processes with COMMAND_KILL, default is False.
         :return: Nothing
         """
         if kwargs.get("kill", False):
-            self.kill()
+            call(self.COMMAND_KILL)
         self.rtlfm_process = Popen(self.COMMAND_RTLFM, stdout=PIPE)
-        self.multi_process = Popen(self.COMMAND_MULTI, stdin=self.rtlfm_process.stdout, stdout=PIPE)
+        self.multi_process = Popen(
+            self.COMMAND_MULTI, stdin=self.rtlfm_process.stdout, stdout=PIPE, bufsize=0
+        )
         self.stdout = self.multi_process.stdout
 
     def kill(self):
         """
-        Kill the connection with COMMAND_KILL.
+        Kill the processes spawned by open() that are still running and wait for them to exit.
+        Their stdout pipes are closed and self.stdout is reset, so the connection can be opened again.
         :return: Nothing
         """
-        call(self.COMMAND_KILL)
+        for process in (self.rtlfm_process, self.multi_process):
+            if process is not None:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                if process.stdout is not None:
+                    process.stdout.close()
+        self.stdout = None
 
 
 class AbstractReader:
@@ -77,18 +117,58 @@ class AbstractReader:
     A Reader can act on a line received by any Connection that is attached to the Reader.
     The user should extend this class and create his/her own implementation of the act(line) method.
 
-    :ivar blacklist_messages: An array of messages contained in config.json
-    :ivar blacklist_monitorcodes: An array of monitorcodes contained in config.json
+    :ivar blacklist_messages: A frozenset of messages contained in config.json, assigned messages are stored as a frozenset.
+    :ivar blacklist_monitorcodes: A frozenset of monitorcodes contained in config.json, assigned codes are stored
+        as an interned frozenset and also rebuild the read only blacklist_monitorcodes_raw.
     :ivar encoding: The encoding for the received lines, default is UTF-8.
     :ivar connection: The connection to act on, set and unset with attach and detach respectively.
     """
 
+    READ_SIZE = 1 << 16  # Equal to the default pipe capacity on Linux.
+
     def __init__(self, **kwargs):
-        self.blacklist_messages = utils.load_config()["rtlsdr"]["blacklist"]["messages"]
-        self.blacklist_monitorcodes = utils.load_config()["rtlsdr"]["blacklist"]["monitorcodes"]
+        blacklist = utils.load_config()["rtlsdr"]["blacklist"]
         self.encoding = kwargs.get("encoding", "utf-8")
+        self.blacklist_messages = blacklist["messages"]
+        self.blacklist_monitorcodes = blacklist["monitorcodes"]
         self.connection = None
 
+    @property
+    def blacklist_messages(self):
+        """
+        The blacklisted messages, assigning any iterable of messages stores them as a frozenset.
+        :return: A frozenset with the blacklisted messages.
+        """
+        return self._blacklist_messages
+
+    @blacklist_messages.setter
+    def blacklist_messages(self, messages):
+        self._blacklist_messages = frozenset(messages)
+
+    @property
+    def blacklist_monitorcodes(self):
+        """
+        The blacklisted monitorcodes, assigning any iterable of codes stores them as an interned frozenset
+        and rebuilds blacklist_monitorcodes_raw with self.encoding.
+        Assign the codes again after changing self.encoding.
+        :return: A frozenset with the blacklisted monitorcodes.
+        """
+        return self._blacklist_monitorcodes
+
+    @blacklist_monitorcodes.setter
+    def blacklist_monitorcodes(self, codes):
+        self._blacklist_monitorcodes = frozenset(sys.intern(code) for code in codes)
+        self._blacklist_monitorcodes_raw = frozenset(code.encode(self.encoding) for code in self._blacklist_monitorcodes)
+
+    @property
+    def blacklist_monitorcodes_raw(self):
+        """
+        The blacklisted monitorcodes encoded with self.encoding, see is_raw_blacklisted.
+        Read only, it is derived from blacklist_monitorcodes whenever those are assigned.
+        :return: A frozenset with the encoded monitorcodes.
+        """
+        return self._blacklist_monitorcodes_raw
+
     @abc.abstractmethod
     def act(self, line):
         """
@@ -129,7 +209,8 @@ class AbstractReader:
         """
         Set the connection to the instance and open it.
         As soon as the connection is opened a loop is started on stdout of the connection.
-        Each line that is received wil be acted upon with the act(line) method.
+        The stdout file descriptor is read in chunks of up to READ_SIZE bytes and split on newlines.
+        Each line that is received wil be acted upon with the act(line) method, newline included.
         The connection is always detached in case of error or a finished process.
 
         :param connection: The connection to set up.
@@ -138,8 +219,22 @@ class AbstractReader:
         try:
             self.connection = connection
             connection.open()
-            for line in self.connection.stdout:
-                self.act(line)
+            act = self.act
+            fd = connection.stdout.fileno()
+            pending = b""
+            chunk = os.read(fd, self.READ_SIZE)
+            while chunk:
+                data = pending + chunk
+                start = 0
+                end = data.find(b"\n")
+                while end > -1:
+                    act(data[start:end + 1])
+                    start = end + 1
+                    end = data.find(b"\n", start)
+                pending = data[start:]
+                chunk = os.read(fd, self.READ_SIZE)
+            if pending:
+                act(pending)
         finally:
             self.detach()
 
@@ -154,7 +249,7 @@ class AbstractReader:
         decoded = line.decode(self.encoding)
         return decoded.rstrip() if strip else decoded
 
-    def create_line(self, line, **kwargs):
+    def create_line(self, line, *, decode=True, strip=True):
         """
         Create a new FLEX Line object from the given raw line.
 
@@ -163,19 +258,33 @@ class AbstractReader:
         :keyword strip: Tf the line should be stripped of newlines, default is True.
         :return: A new FLEX Line object based on the line parameter.
         """
-        strip = kwargs.get("strip", True)
-        decode = kwargs.get("decode", True)
         return Line(self.decode_line(line, strip=strip) if decode else line)
 
     def is_line_blacklisted(self, line):
         """
         Check to see if the given line is in the blacklist.
         The blacklist is checked for monitorcodes and messages.
+        A raw line is turned into a FLEX Line object only once for both checks.
 
-        :param line: The line to check against the blacklist.
+        :param line: The line to check against the blacklist, either raw or a FLEX Line object.
         :return: True if the line is blacklisted.
         """
-        return self.is_monitorcode_blacklisted(line) or self.is_message_blacklisted(line)
+        if not isinstance(line, Line):
+            line = self.create_line(line)
+        # The backing sets are read directly, the property getters would cost a Python call per line.
+        return line.monitorcode in self._blacklist_monitorcodes or line.message in self._blacklist_messages
+
+    def is_raw_blacklisted(self, line):
+        """
+        Check to see if the monitorcode of the given raw line is in the blacklist, without creating a FLEX Line object.
+        Only the bytes between the first "[" and the next "]" are compared, so self.encoding must be ASCII compatible.
+
+        :param line: The raw line as received from the connection.
+        :return: True if the monitorcode is blacklisted, False if it is not or if the line has no monitorcode.
+        """
+        start = line.find(b"[") + 1
+        end = line.find(b"]", start)
+        return start > 0 and end > -1 and line[start:end] in self._blacklist_monitorcodes_raw
 
     def is_monitorcode_blacklisted(self, line):
         """
@@ -186,9 +295,9 @@ class AbstractReader:
         :return: True if the line is blacklisted.
         """
         if isinstance(line, Line):
-            return line.monitorcode in self.blacklist_monitorcodes
+            return line.monitorcode in self._blacklist_monitorcodes
         else:
-            return self.create_line(line).monitorcode in self.blacklist_monitorcodes
+            return self.create_line(line).monitorcode in self._blacklist_monitorcodes
 
     def is_message_blacklisted(self, line):
         """
@@ -199,6 +308,6 @@ class AbstractReader:
         :return: True if the line is blacklisted.
         """
         if isinstance(line, Line):
-            return line.message in self.blacklist_messages
+            return line.message in self._blacklist_messages
         else:
-            return self.create_line(line).message in self.blacklist_messages
+            return self.create_line(line).message in self._blacklist_messages
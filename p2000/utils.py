@@ -1,3 +1,4 @@
+import copy
 import json
 import os
 import subprocess
@@ -5,14 +6,21 @@ import subprocess
 
 DEVNULL = open(os.devnull, 'w')
 
+_CONFIG = None
+
 
 def load_config():
     """
     Load the config file as JSON.
+    The file is only read and parsed once, every call returns its own copy of the cached dict,
+    so changes made by one caller do not leak into the config of another.
     :return: The config file as JSON.
     """
-    with open('./resources/config.json') as f:
-        return json.load(f)
+    global _CONFIG
+    if _CONFIG is None:
+        with open('./resources/config.json') as f:
+            _CONFIG = json.load(f)
+    return copy.deepcopy(_CONFIG)
 
 
 def is_rtlfm_installed():
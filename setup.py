@@ -4,6 +4,7 @@ setup(
     name='Piton 2000',
     version='0.0.1',
     packages=find_packages(exclude=['examples', 'tests*']),
+    python_requires='>=3.6',
     url='https://github.com/MalumAtire832/P2000',
     license='GPL-3.0',
     author='Harjan Knapper',
@@ -0,0 +1,166 @@
+import pickle
+import sys
+import unittest
+from subprocess import Popen, PIPE
+
+from p2000.rtlsdr import Line, Connection, AbstractReader
+
+
+# noinspection SpellCheckingInspection
+class TestRtlsdrLine(unittest.TestCase):
+
+    RAW = "FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] ALN TESTOPROEP BACK-UP SYSTEEM GMC BN (2) ALN"
+
+    def setUp(self):
+        pass
+
+    def test_line_normal(self):
+        line = Line(self.RAW)
+        self.assertEqual(line.line, self.RAW)
+        self.assertEqual(line.timestamp, "2018-07-26")
+        self.assertEqual(line.monitorcode, "001523172")
+        self.assertEqual(line.message, "ALN TESTOPROEP BACK-UP SYSTEEM GMC BN (2)")
+
+    def test_line_short_message(self):
+        self.assertEqual(Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A1 A2").message, "A1")
+        self.assertEqual(Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A1").message, "")
+        self.assertEqual(Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172]").message, "")
+        self.assertEqual(Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 001523172 A1 A2").monitorcode, "001523172")
+
+    def test_line_whitespace(self):
+        line = Line("  FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A1 X")
+        self.assertEqual(line.timestamp, "2018-07-26")
+        self.assertEqual(line.monitorcode, "001523172")
+        self.assertEqual(line.message, "A1")
+        self.assertEqual(Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A  B   C").message, "A  B")
+
+        line = Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172]" + " " * 100000 + "X")
+        self.assertEqual(line.monitorcode, "001523172")
+        self.assertEqual(line.message, "")
+        line = Line("FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A1" + " " * 100000 + "X")
+        self.assertEqual(line.message, "A1")
+
+    def test_line_custom(self):
+        line = Line(self.RAW, timestamp="mTimestamp", monitorcode="1234", message="testcase")
+        self.assertEqual(line.line, self.RAW)
+        self.assertEqual(line.timestamp, "mTimestamp")
+        self.assertEqual(line.monitorcode, "1234")
+        self.assertEqual(line.message, "testcase")
+
+        line = Line(self.RAW, monitorcode="1234")
+        self.assertEqual(line.timestamp, "2018-07-26")
+        self.assertEqual(line.monitorcode, "1234")
+
+        line = Line("invalid", timestamp="mTimestamp", monitorcode="1234", message="testcase")
+        self.assertEqual(line.message, "testcase")
+
+    def test_line_pickle(self):
+        line = pickle.loads(pickle.dumps(Line(self.RAW, message="testcase")))
+        self.assertEqual(line.line, self.RAW)
+        self.assertEqual(line.timestamp, "2018-07-26")
+        self.assertEqual(line.monitorcode, "001523172")
+        self.assertEqual(line.message, "testcase")
+
+    def test_line_str(self):
+        line = Line("raw", timestamp="mTimestamp", monitorcode="1234", message="testcase")
+        self.assertEqual(str(line), "@line = raw\n\t@message = testcase\n\t@timestamp = mTimestamp\n\t@monitorcode = 1234")
+
+    def test_line_invalid(self):
+        self.assertRaises(ValueError, Line, "invalid")
+        self.assertRaises(ValueError, Line, "FLEX: 2018-07-26 15:09:42")
+        self.assertFalse(hasattr(Line(self.RAW), "unknown"))
+
+
+class TestRtlsdrConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = Connection()
+
+    def test_kill(self):
+        self.connection.kill()
+        self.connection.rtlfm_process = Popen([sys.executable, "-c", "import time; time.sleep(10)"], stdout=PIPE)
+        self.connection.stdout = self.connection.rtlfm_process.stdout
+        self.connection.kill()
+        self.assertNotEqual(self.connection.rtlfm_process.returncode, None)
+        self.assertEqual(self.connection.rtlfm_process.stdout.closed, True)
+        self.assertEqual(self.connection.stdout, None)
+        self.connection.kill()
+
+
+class EchoConnection(Connection):
+    """
+    A Connection that spawns a Python process writing the given chunks instead of the radio commands.
+    """
+
+    def __init__(self, chunks):
+        super(EchoConnection, self).__init__()
+        self.chunks = chunks
+
+    def open(self, **kwargs):
+        script = "import sys, time\nfor c in {0!r}:\n sys.stdout.buffer.write(c); sys.stdout.flush(); time.sleep(0.01)"
+        self.multi_process = Popen([sys.executable, "-c", script.format(self.chunks)], stdout=PIPE, bufsize=0)
+        self.stdout = self.multi_process.stdout
+
+
+class CollectReader(AbstractReader):
+
+    def __init__(self, **kwargs):
+        super(CollectReader, self).__init__(**kwargs)
+        self.lines = []
+
+    def act(self, line):
+        self.lines.append(line)
+
+
+# noinspection SpellCheckingInspection
+class TestRtlsdrReader(unittest.TestCase):
+
+    RAW = b"FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] ALN TESTOPROEP BACK-UP SYSTEEM GMC BN (2) ALN\n"
+    RAW_VALID = b"FLEX: 2018-07-26 15:09:42 1600/2/K/A 10.120 [001523172] A1 BRAND WONING ALN\n"
+
+    def setUp(self):
+        self.reader = AbstractReader()
+        self.reader.blacklist_monitorcodes = frozenset(["000120901"])
+
+    def test_create_line(self):
+        line = self.reader.create_line(self.RAW_VALID)
+        self.assertEqual(line.line, self.RAW_VALID.decode("utf-8").rstrip())
+        self.assertEqual(line.monitorcode, "001523172")
+        self.assertEqual(line.message, "A1 BRAND WONING")
+        self.assertEqual(self.reader.create_line(b"  " + self.RAW_VALID).message, "A1 BRAND WONING")
+
+    def test_is_line_blacklisted(self):
+        self.assertEqual(self.reader.is_line_blacklisted(self.RAW), True)
+        self.assertEqual(self.reader.is_line_blacklisted(self.reader.create_line(self.RAW)), True)
+        self.assertEqual(self.reader.is_line_blacklisted(self.RAW_VALID), False)
+        self.assertEqual(self.reader.is_line_blacklisted(self.RAW_VALID.replace(b"001523172", b"000120901")), True)
+
+    def test_is_raw_blacklisted(self):
+        self.assertEqual(self.reader.is_raw_blacklisted(self.RAW), False)
+        self.assertEqual(self.reader.is_raw_blacklisted(self.RAW_VALID.replace(b"001523172", b"000120901")), True)
+        self.assertEqual(self.reader.is_raw_blacklisted(b"FLEX: 2018-07-26 15:09:42 000120901 A1"), False)
+        self.assertEqual(self.reader.is_raw_blacklisted(b"FLEX: 2018-07-26 15:09:42 [000120901 A1"), False)
+
+    def test_blacklist_monitorcodes(self):
+        self.assertEqual(self.reader.blacklist_monitorcodes_raw, frozenset([b"000120901"]))
+        self.reader.blacklist_monitorcodes = ["001523172", "000120901"]
+        self.assertEqual(self.reader.blacklist_monitorcodes, frozenset(["001523172", "000120901"]))
+        self.assertEqual(self.reader.blacklist_monitorcodes_raw, frozenset([b"001523172", b"000120901"]))
+        self.assertEqual(self.reader.is_raw_blacklisted(self.RAW), self.reader.is_line_blacklisted(self.RAW))
+        self.assertRaises(AttributeError, setattr, self.reader, "blacklist_monitorcodes_raw", frozenset())
+
+    def test_blacklist_messages(self):
+        self.reader.blacklist_messages = ["A1 BRAND WONING"]
+        self.assertEqual(self.reader.blacklist_messages, frozenset(["A1 BRAND WONING"]))
+        self.assertEqual(self.reader.is_line_blacklisted(self.RAW_VALID), True)
+        self.assertEqual(self.reader.is_line_blacklisted(self.RAW), False)
+
+    def test_attach(self):
+        reader = CollectReader()
+        reader.attach(EchoConnection([b"first\nsec", b"ond\n", b"\nthird\nfou", b"rth"]))
+        self.assertEqual(reader.lines, [b"first\n", b"second\n", b"\n", b"third\n", b"fourth"])
+        self.assertEqual(reader.connection, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
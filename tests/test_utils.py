@@ -0,0 +1,19 @@
+import unittest
+
+from p2000 import utils
+
+
+class TestUtilsConfig(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def test_load_config(self):
+        config = utils.load_config()
+        self.assertEqual(config, utils.load_config())
+        config["rtlsdr"]["blacklist"]["messages"].append("testcase")
+        self.assertNotIn("testcase", utils.load_config()["rtlsdr"]["blacklist"]["messages"])
+
+
+if __name__ == '__main__':
+    unittest.main()